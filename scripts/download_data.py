@@ -18,8 +18,11 @@ from config import (
     BINANCE_API_KEY, BINANCE_API_SECRET, 
     BYBIT_API_KEY, BYBIT_API_SECRET,
     ACTIVE_EXCHANGES, BINANCE_SYMBOLS, BYBIT_SYMBOLS,
-    MACRO_SYMBOLS
+    MACRO_SYMBOLS, OHLCV_DISK_FORMAT
 )
+from utils.time_helper import ensure_datetime
+from utils.symbol_helper import to_api_format
+from utils.ohlcv_io import resolve_ohlcv_path, read_ohlcv, write_ohlcv
 
 async def download_historical_data(symbol, timeframe, exchange_name='BINANCE', limit=5000, semaphore=None):
     """Download OHLCV data for a symbol/timeframe pair with 5k candle limit and rate-limit safety."""
@@ -38,8 +41,10 @@ def get_timeframe_seconds(timeframe: str) -> int:
     return 60
 
 async def _download_inner(symbol, timeframe, exchange_name, limit):
-    safe_symbol = symbol.split(':')[0].replace('/', '').upper()
-    filename = f"data/{exchange_name}_{safe_symbol}_{timeframe}.csv"
+    safe_symbol = to_api_format(symbol)
+    base_path = f"data/{exchange_name}_{safe_symbol}_{timeframe}"
+    # Disk I/O runs in worker threads so parallel downloads keep the event loop free
+    filename = await asyncio.to_thread(resolve_ohlcv_path, base_path)
     
     # Bybit-specific timeframe mapping for API compatibility
     api_timeframe = timeframe
@@ -56,11 +61,10 @@ async def _download_inner(symbol, timeframe, exchange_name, limit):
     window_ms = limit * tf_seconds * 1000
     target_since = now_ms - window_ms
 
-    if os.path.exists(filename):
+    if filename:
         try:
-            existing_df = pd.read_csv(filename)
+            existing_df = await asyncio.to_thread(read_ohlcv, filename)
             if not existing_df.empty:
-                existing_df['timestamp'] = pd.to_datetime(existing_df['timestamp'])
                 last_ts = int(existing_df['timestamp'].iloc[-1].timestamp() * 1000)
                 
                 # If the gap is too large (> 5000 candles), we just restart from target_since
@@ -134,7 +138,7 @@ async def _download_inner(symbol, timeframe, exchange_name, limit):
             
         if all_ohlcv:
             new_df = pd.DataFrame(all_ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-            new_df['timestamp'] = pd.to_datetime(new_df['timestamp'], unit='ms')
+            new_df['timestamp'] = ensure_datetime(new_df['timestamp'])
             
             if existing_df is not None:
                 df = pd.concat([existing_df, new_df]).drop_duplicates(subset=['timestamp'], keep='last').sort_values('timestamp')
@@ -147,7 +151,7 @@ async def _download_inner(symbol, timeframe, exchange_name, limit):
         df = df.tail(limit)
         
         os.makedirs('data', exist_ok=True)
-        df.to_csv(filename, index=False)
+        await asyncio.to_thread(write_ohlcv, df, base_path, OHLCV_DISK_FORMAT)
         print(f"  [OK] {exchange_name} {symbol:12s} {timeframe:3s} -> {len(df):5d} candles (Last: {df['timestamp'].iloc[-1]})")
         return 2 if all_ohlcv else 1
 
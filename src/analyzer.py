@@ -37,6 +37,7 @@ from src.feature_engineering import FeatureEngineer
 import subprocess
 from src.train_brain import run_nn_training
 from src.utils.symbol_helper import to_api_format
+from src.utils.ohlcv_io import resolve_ohlcv_path, read_ohlcv
 
 class StrategyAnalyzer:
     def __init__(self, data_dir=None):
@@ -62,19 +63,16 @@ class StrategyAnalyzer:
         
         # Standardize symbol for file path (e.g. BTC/USDT:USDT -> BTCUSDT)
         safe_symbol = to_api_format(symbol)
-        # Data files: {EXCHANGE}_{SYMBOL}_{TF}.csv  OR legacy  {SYMBOL}_{TF}.csv
-        file_path = os.path.join(self.data_dir, f"{exchange}_{safe_symbol}_{timeframe}.csv")
+        # Data files: {EXCHANGE}_{SYMBOL}_{TF}.parquet|csv  OR legacy  {SYMBOL}_{TF}.parquet|csv
+        file_path = resolve_ohlcv_path(os.path.join(self.data_dir, f"{exchange}_{safe_symbol}_{timeframe}"))
         
-        if not os.path.exists(file_path):
+        if not file_path:
             # Fallback 1: legacy without exchange prefix
-            legacy_path = os.path.join(self.data_dir, f"{safe_symbol}_{timeframe}.csv")
-            if os.path.exists(legacy_path):
-                file_path = legacy_path
-            else:
+            file_path = resolve_ohlcv_path(os.path.join(self.data_dir, f"{safe_symbol}_{timeframe}"))
+            if not file_path:
                 return None
             
-        df = pd.read_csv(file_path)
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
+        df = read_ohlcv(file_path)
         
         if len(df) > 200:
             df['ema_200'] = df['close'].ewm(span=200, adjust=False).mean()
@@ -12,6 +12,8 @@ from src.strategy import WeightedScoringStrategy
 from data_fetcher import DataFetcher
 import asyncio
 from src.risk_manager import RiskManager
+from src.utils.symbol_helper import to_api_format
+from src.utils.ohlcv_io import resolve_ohlcv_path, read_ohlcv, write_ohlcv
 from unittest.mock import MagicMock, AsyncMock
 
 class Backtester:
@@ -48,20 +50,19 @@ class Backtester:
         print(f"[{self.symbol}] Strategy Status: {status} ({len(wa)} parameters)")
         
         # Check cache first — strip :USDT suffix -> BTC/USDT:USDT -> BTCUSDT
-        safe_symbol = self.symbol.split(':')[0].replace('/', '')
+        safe_symbol = to_api_format(self.symbol)
         exchange = self.exchange
         
         # Try exchange-prefixed first, then legacy
-        file_path_ex = os.path.join(self.data_dir, f"{exchange}_{safe_symbol}_{self.timeframe}.csv")
-        file_path_leg = os.path.join(self.data_dir, f"{safe_symbol}_{self.timeframe}.csv")
-        file_path = file_path_ex if os.path.exists(file_path_ex) else file_path_leg
+        base_path_ex = os.path.join(self.data_dir, f"{exchange}_{safe_symbol}_{self.timeframe}")
+        base_path_leg = os.path.join(self.data_dir, f"{safe_symbol}_{self.timeframe}")
+        file_path = await asyncio.to_thread(lambda: resolve_ohlcv_path(base_path_ex) or resolve_ohlcv_path(base_path_leg))
 
         df = None
         # 1. Try Load from Disk
-        if os.path.exists(file_path):
+        if file_path:
             print(f"[{self.symbol}] Loading data from cache: {os.path.basename(file_path)}")
-            df = pd.read_csv(file_path)
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
+            df = await asyncio.to_thread(read_ohlcv, file_path)
         
         # 2. If no cache, Fetch from API
         if df is None or df.empty:
@@ -72,7 +73,7 @@ class Backtester:
             
             if df is not None and not df.empty:
                 print(f"[{self.symbol}] Saving data to cache...")
-                df.to_csv(file_path_leg, index=False)
+                await asyncio.to_thread(write_ohlcv, df, base_path_leg, config.OHLCV_DISK_FORMAT)
         
         if df is None or df.empty:
             print(f"[{self.symbol}] No data found.")
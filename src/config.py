@@ -88,6 +88,8 @@ MIN_WINRATE_THRESHOLD = 0.50  # Minimum winrate (50%) required to trade a signal
 HEARTBEAT_INTERVAL = 5  # Main loop interval in seconds (Slow loop)
 FAST_HEARTBEAT_INTERVAL = 1.0  # Fast loop interval when data is fresh (Quick check)
 OHLCV_REFRESH_INTERVAL = 60  # OHLCV data refresh interval in seconds (1 minute)
+# On-disk candle format for downloaded history: 'csv' (default) or 'parquet' (requires pyarrow)
+OHLCV_DISK_FORMAT = os.getenv('OHLCV_DISK_FORMAT', 'csv').lower()
 
 # Confidence-Based Position Sizing (Conservative Settings)
 # Bot will allocate capital and leverage based on signal confidence
@@ -4,6 +4,7 @@ import pandas as pd
 import os
 import time
 from src.config import BINANCE_API_KEY, BINANCE_API_SECRET
+from src.utils.time_helper import ensure_datetime
 
 class DataFetcher:
     def __init__(self, exchange_id='binance', symbol='BTC/USDT', timeframe='1h'):
@@ -65,7 +66,7 @@ class DataFetcher:
         try:
             ohlcv = await self.exchange.fetch_ohlcv(self.symbol, self.timeframe, limit=limit)
             df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+            df['timestamp'] = ensure_datetime(df['timestamp'])
             return df
         except Exception as e:
             print(f"Error fetching OHLCV: {e}")
@@ -101,7 +102,7 @@ class DataFetcher:
         os.makedirs(data_dir, exist_ok=True)
         
         filename = os.path.join(data_dir, f"data_{self.symbol.replace('/', '_').replace(':', '_')}_{self.timeframe}.csv")
-        df.to_csv(filename, index=False)
+        await asyncio.to_thread(df.to_csv, filename, index=False)
         print(f"Saved {len(df)} rows to {filename}")
         return df
 
@@ -5,6 +5,8 @@ import time
 import pandas as pd
 import numpy as np
 import logging
+import threading
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional, Callable, Set
 
 # Add src to path if running directly or from root
@@ -13,24 +15,113 @@ if src_dir not in sys.path:
     sys.path.append(src_dir)
 
 import ccxt.async_support as ccxt
+from src import config
 from src.config import ACTIVE_EXCHANGE, OHLCV_REFRESH_INTERVAL
 
+# Max in-flight OHLCV requests per exchange during update_data()
+FETCH_CONCURRENCY = 5             # Upper bound; slow venues get fewer slots from their ccxt rateLimit
+MAX_CANDLES = 1000
+# Memory bounds for long-running sessions
+FEATURES_CACHE_CAPACITY = 256     # LRU cap on computed feature frames
+DATA_STORE_IDLE_TTL = 6 * 3600    # Drop raw keys untouched for this long (at least 2 candle periods)
+EVICTION_SWEEP_CYCLES = 100       # Run the idle sweep every N update_data() cycles
+OHLCV_COLS = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+REQUIRED_COLS = frozenset(OHLCV_COLS)
+# Positional indices into OHLCV_COLS frames (every data_store frame shares this schema)
+HIGH_IDX, LOW_IDX, CLOSE_IDX = 2, 3, 4
+
+
+class CandleRing:
+    """
+    Fixed-capacity OHLCV buffer backing one data_store key.
+    Arrays are allocated once; new candles are copied in place and the DataFrame
+    handed out by frame() wraps the buffers without copying.
+    """
+    def __init__(self, capacity: int = MAX_CANDLES):
+        self.capacity = capacity
+        self.ts = np.zeros(capacity, dtype=np.int64)          # epoch ms
+        self.buf = np.zeros((capacity, 5), dtype=np.float64)  # open, high, low, close, volume
+        self.size = 0
+        self._frame = None
+
+    def extend(self, ts: np.ndarray, rows: np.ndarray):
+        """Append sorted candles, overwriting any stored candle at or after ts[0]."""
+        k = len(ts)
+        if k == 0: return
+        if k > self.capacity:
+            ts, rows, k = ts[-self.capacity:], rows[-self.capacity:], self.capacity
+        
+        keep = int(np.searchsorted(self.ts[:self.size], ts[0], side='left'))
+        overflow = keep + k - self.capacity
+        if overflow > 0:
+            # Full: shift the retained history left in place (numpy handles the overlap)
+            self.ts[:keep - overflow] = self.ts[overflow:keep]
+            self.buf[:keep - overflow] = self.buf[overflow:keep]
+            keep -= overflow
+        
+        self.ts[keep:keep + k] = ts
+        self.buf[keep:keep + k] = rows
+        if keep + k != self.size:
+            self._frame = None
+        self.size = keep + k
+
+    def extend_frame(self, df: pd.DataFrame):
+        """Append an OHLCV DataFrame (naive or tz-aware timestamps)."""
+        ts = df['timestamp'].values.astype('datetime64[ms]').view(np.int64)
+        self.extend(ts, df[OHLCV_COLS[1:]].to_numpy(dtype=np.float64))
+
+    def patch_last(self, last_price: float):
+        """Bridge the live price into the newest candle (close + high/low extremes)."""
+        row = self.buf[self.size - 1]
+        row[CLOSE_IDX - 1] = last_price
+        if last_price > row[HIGH_IDX - 1]: row[HIGH_IDX - 1] = last_price
+        if last_price < row[LOW_IDX - 1]: row[LOW_IDX - 1] = last_price
+
+    def frame(self) -> pd.DataFrame:
+        """Zero-copy DataFrame view over the filled part of the buffer."""
+        if self._frame is None:
+            df = pd.DataFrame(self.buf[:self.size], columns=OHLCV_COLS[1:], copy=False)
+            df.insert(0, 'timestamp', self.ts[:self.size].view('datetime64[ms]'))
+            self._frame = df
+        return self._frame
+
+    def arrays(self) -> tuple:
+        """(ts, open, high, low, close, volume) ndarray views over the filled part of the buffer."""
+        n = self.size
+        return (self.ts[:n],) + tuple(self.buf[:n, i] for i in range(5))
+
+    def backs(self, df: Optional[pd.DataFrame]) -> bool:
+        """True if df is the current view of this ring (i.e. nobody replaced it in data_store)."""
+        return df is not None and df is self._frame
+
+
 class MarketDataManager:
     """
     Singleton Market Data Manager.
     Handles OHLCV fetching, synchronization across exchanges, and SQLite caching.
     """
     _instance = None
+    _init_lock = threading.Lock()  # Executor threads may construct the manager too
 
     def __new__(cls, *args, **kwargs):
-        if not cls._instance:
-             cls._instance = super(MarketDataManager, cls).__new__(cls)
-             cls._instance.initialized = False
+        # Double-checked: the lock is only taken until the singleton exists.
+        # Constructor args belong to __init__ and are not forwarded to object.__new__.
+        if cls._instance is None:
+            with cls._init_lock:
+                if cls._instance is None:
+                    instance = object.__new__(cls)
+                    instance.initialized = False
+                    cls._instance = instance
         return cls._instance
 
     def __init__(self, db=None, adapters=None):
-        if hasattr(self, 'initialized') and self.initialized: return
-        self.initialized = True
+        if self.initialized: return
+        with self._init_lock:
+            if self.initialized: return
+            self._setup(db, adapters)
+            self.initialized = True
+
+    def _setup(self, db, adapters):
         self.db = db
         self.logger = logging.getLogger("MarketDataManager")
         
@@ -49,15 +140,46 @@ class MarketDataManager:
             self.adapter = None
         
         self.data_store = {} # { 'EXCHANGE_symbol_timeframe': df }
-        self.features_cache = {}  # { 'EXCHANGE_symbol_timeframe': df_with_features }
+        self._rings = {}      # { 'EXCHANGE_symbol_timeframe': CandleRing } backing data_store frames
+        self.features_cache = OrderedDict()  # LRU { 'EXCHANGE_symbol_timeframe': df_with_features }
+        self._last_access = {}     # { 'EXCHANGE_symbol_timeframe': epoch seconds of last read/write }
         self._last_ohlcv_update = 0.0
         self._ticker_cache = {}    # { 'EXCHANGE_symbol': {'last': price, 'timestamp': ts} }
         self._stagger_index = 0    # Current group index for staggered updates
         self._cooldown_manager = None
         self._active_symbols_provider = None # Callable returning list of symbols
         self._ohlcv_sync_state = {} # { key: last_period_timestamp }
+        self._last_saved_ts = {}    # { key: epoch ms of the newest candle persisted to SQLite }
         self._update_counter = 0
         self._feature_engineer = None
+        self._allowed_sets = {}    # { 'EXCHANGE': (source_list, len, frozenset) }
+        self._throttles = {}       # { 'EXCHANGE': (Semaphore, spacing_seconds) } sized from adapter rateLimit
+        self._features_locks = {}  # { key: threading.Lock } serializing feature calc per key
+        self._features_locks_guard = threading.Lock()
+
+    def _allowed_symbols(self, name: str) -> Optional[frozenset]:
+        """Configured symbols for an exchange as a frozenset, rebuilt only when the config list changes."""
+        # Read through the module so runtime config reloads/patches are still picked up
+        source = {'BINANCE': config.BINANCE_SYMBOLS, 'BYBIT': config.BYBIT_SYMBOLS}.get(name)
+        if source is None: return None
+        cached = self._allowed_sets.get(name)
+        if cached is None or cached[0] is not source or cached[1] != len(source):
+            cached = (source, len(source), frozenset(source))
+            self._allowed_sets[name] = cached
+        return cached[2]
+
+    def _get_throttle(self, name: str, adapter) -> tuple:
+        """Per-exchange (semaphore, spacing) derived from the ccxt rateLimit (ms between requests)."""
+        throttle = self._throttles.get(name)
+        if throttle is None:
+            rate_ms = getattr(getattr(adapter, 'exchange', None), 'rateLimit', None)
+            if isinstance(rate_ms, (int, float)) and rate_ms > 0:
+                slots = max(1, min(FETCH_CONCURRENCY, int(1000 / rate_ms)))
+                throttle = (asyncio.Semaphore(slots), rate_ms / 1000.0)
+            else:
+                throttle = (asyncio.Semaphore(FETCH_CONCURRENCY), 0.0)
+            self._throttles[name] = throttle
+        return throttle
 
     def _get_feature_engineer(self):
         if self._feature_engineer is None:
@@ -109,14 +231,20 @@ class MarketDataManager:
         if curr_time - self._last_ticker_update < 1.0: return 0
         self._last_ticker_update = curr_time
         
-        from src import config
-        exchange_symbol_map = {'BINANCE': config.BINANCE_SYMBOLS, 'BYBIT': config.BYBIT_SYMBOLS}
+        # Index stored frames by (exchange, symbol) once so each ticker is a hash lookup
+        # instead of a prefix scan over every data_store key.
+        frames_by_symbol = {}
+        for key, df in self.data_store.items():
+            if df is None or df.empty: continue
+            ex_name, rest = key.split('_', 1)
+            symbol = rest.rsplit('_', 1)[0]
+            frames_by_symbol.setdefault((ex_name, symbol), []).append(key)
         
         total_updated = 0
         for name, adapter in self.adapters.items():
             try:
-                allowed = exchange_symbol_map.get(name, symbols)
-                current = [s for s in symbols if s in allowed]
+                allowed = self._allowed_symbols(name)
+                current = [s for s in symbols if s in allowed] if allowed is not None else list(symbols)
                 if not current: continue
                 
                 tickers = await adapter.fetch_tickers(current)
@@ -129,10 +257,15 @@ class MarketDataManager:
                         # Update Cache
                         self._ticker_cache[f"{name}_{symbol}"] = {'last': last_price, 'timestamp': curr_ts}
                         
-                        for key, df in self.data_store.items():
-                            if key.startswith(f"{name}_{symbol}_") and not df.empty:
+                        for key in frames_by_symbol.get((name, symbol), ()):
+                            df = self.data_store[key]
+                            ring = self._rings.get(key)
+                            if ring is not None and ring.backs(df):
+                                # Write straight into the ring; the stored frame is a view over it
+                                ring.patch_last(last_price)
+                            else:
                                 self.data_store[key] = self._patch_current_candle(df, last_price)
-                                updated_keys.add(key)
+                            updated_keys.add(key)
                 
                 # Refresh features for all patched DataFrames so signals (EMA, RSI) reflect the live price
                 # We clear the features_cache so the next get_data_with_features() call triggers a recalc.
@@ -160,11 +293,9 @@ class MarketDataManager:
             return False 
 
         self._last_ohlcv_update = curr_time
-        MAX_CANDLES = 1000 
         self._update_counter += 1
-        
-        from src import config
-        exchange_symbol_map = {'BINANCE': config.BINANCE_SYMBOLS, 'BYBIT': config.BYBIT_SYMBOLS}
+        if self._update_counter % EVICTION_SWEEP_CYCLES == 0:
+            self._evict_idle_keys(curr_time)
         
         # 1. Prioritization Logic
         # Active symbols (positions/orders) update EVERY cycle (~10-15s)
@@ -191,69 +322,73 @@ class MarketDataManager:
         
         self.logger.info(f"🔄 Data Sync: {len(active_symbols)} Priorities + Group {self._stagger_index % GROUP_COUNT} ({len(background_batch)} symbols)")
         
-        semaphore = asyncio.Semaphore(5)
-        
-        async def fetch_and_store(name, adapter, symbol, timeframes):
+        async def fetch_and_store(name, adapter, symbol, tf):
+            # Each exchange has its own bucket, so Binance and Bybit fetches run side by side
+            semaphore, spacing = self._get_throttle(name, adapter)
             async with semaphore:
+                key = f"{name}_{symbol}_{tf}"
                 try:
-                    # 2. Skip if symbol is in SL cooldown
-                    if self._cooldown_manager and self._cooldown_manager.is_in_cooldown(name, symbol, 0):
-                        self.logger.debug(f"⏳ Skipping {symbol} (SL Cooldown)")
+                    # 3. Smart Sync: Only fetch if a new candle period has started
+                    # Otherwise, update_tickers() handles live bridging for all timeframes.
+                    if not self._should_fetch_new_candle(name, symbol, tf, adapter):
                         return
+
+                    # 4. Fetch OHLCV for this specific timeframe
+                    ohlcv = await adapter.fetch_ohlcv(symbol, tf, limit=50)
+                    if spacing:
+                        # Hold the slot for one rateLimit interval so a full bucket cannot burst
+                        await asyncio.sleep(spacing)
+                    if not ohlcv: return
                     
-                    for tf in timeframes:
-                        key = f"{name}_{symbol}_{tf}"
-                        
-                        # 3. Smart Sync: Only fetch if a new candle period has started
-                        # Otherwise, update_tickers() handles live bridging for all timeframes.
-                        if not self._should_fetch_new_candle(name, symbol, tf, adapter):
-                            continue
-
-                        # 4. Fetch OHLCV for this specific timeframe
-                        ohlcv = await adapter.fetch_ohlcv(symbol, tf, limit=50)
-                        if not ohlcv: continue
+                    seconds = self._get_timeframe_seconds(tf)
+                    # We use exchange time if available for precision
+                    now_ts_raw = (adapter.exchange.milliseconds() / 1000.0) if hasattr(adapter.exchange, 'milliseconds') and adapter.exchange.milliseconds() else time.time()
+                    current_period_start = (int(now_ts_raw) // seconds) * seconds
+                    self._ohlcv_sync_state[key] = current_period_start
                         
-                        seconds = self._get_timeframe_seconds(tf)
-                        # We use exchange time if available for precision
-                        now_ts_raw = (adapter.exchange.milliseconds() / 1000.0) if hasattr(adapter.exchange, 'milliseconds') and adapter.exchange.milliseconds() else time.time()
-                        current_period_start = (int(now_ts_raw) // seconds) * seconds
-                        self._ohlcv_sync_state[key] = current_period_start
-                            
-                        new_df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-                        new_df['timestamp'] = pd.to_datetime(new_df['timestamp'], unit='ms')
-                        
-                        old_df = self.data_store.get(key)
-                        if old_df is None: 
-                            combined = new_df
-                        else:
-                            # Merge new data and drop duplicates
-                            combined = pd.concat([old_df, new_df]).drop_duplicates(subset='timestamp', keep='last').reset_index(drop=True)
-                            combined = combined.sort_values('timestamp').reset_index(drop=True).tail(MAX_CANDLES)
+                    # Column arrays straight from the raw list: no intermediate DataFrame
+                    arr = np.asarray(ohlcv, dtype=np.float64)
+                    new_ts = arr[:, 0].astype(np.int64)
+                    new_rows = arr[:, 1:6]
+                    
+                    is_valid = not np.isnan(new_rows[-5:, CLOSE_IDX - 1]).any()
+                    if is_valid:
+                        # Copy the new candles into the preallocated ring; overlap is overwritten in place
+                        ring = self._get_ring(key)
+                        ring.extend(new_ts, new_rows)
+                        frame = ring.frame()
+                        if self.data_store.get(key) is not frame:
+                            # Only rebinds while the ring is still filling; a full ring keeps its frame
+                            self.data_store[key] = frame
+                        self._last_access[key] = time.time()
+                        # Invalidate features cache so recalc happens on next access
+                        self.features_cache.pop(key, None)
                         
-                        is_valid, reason = self.validate_data(combined, symbol, tf)
-                        if is_valid:
-                            self.data_store[key] = combined
-                            # Invalidate features cache so recalc happens on next access
-                            self.features_cache.pop(key, None)
-                            
-                            # DB Persist
-                            candles_list = []
-                            for _, row in new_df.iterrows():
-                                ts = int(row['timestamp'].timestamp() * 1000)
-                                candles_list.append([ts, row['open'], row['high'], row['low'], row['close'], row['volume']])
+                        # DB Persist only the delta: the last saved candle (it was still live then) onwards
+                        last_saved = self._last_saved_ts.get(key)
+                        start = 0 if last_saved is None else int(np.searchsorted(new_ts, last_saved, side='left'))
+                        if start < len(new_ts):
+                            candles_list = [[t, *v] for t, v in zip(new_ts[start:].tolist(), new_rows[start:].tolist())]
                             await self.db.upsert_candles(symbol, tf, candles_list)
+                            self._last_saved_ts[key] = int(new_ts[-1])
                 except Exception as e:
-                    self.logger.error(f"[{name}] Error updating {symbol}: {e}")
+                    self.logger.error(f"[{name}] Error updating {symbol} {tf}: {e}")
 
         tasks = []
         for name, adapter in self.adapters.items():
-            allowed = [s for s in current_batch if s in exchange_symbol_map.get(name, [])]
-            for symbol in allowed:
-                # Group all timeframes for this symbol together
-                tasks.append(fetch_and_store(name, adapter, symbol, timeframes))
+            allowed_set = self._allowed_symbols(name) or frozenset()
+            for symbol in current_batch:
+                if symbol not in allowed_set: continue
+                # 2. Skip if symbol is in SL cooldown
+                if self._cooldown_manager and self._cooldown_manager.is_in_cooldown(name, symbol, 0):
+                    self.logger.debug(f"⏳ Skipping {symbol} (SL Cooldown)")
+                    continue
+                # One task per (symbol, timeframe) so timeframes no longer wait on each other
+                for tf in timeframes:
+                    tasks.append(fetch_and_store(name, adapter, symbol, tf))
         
         if tasks:
-            await asyncio.gather(*tasks)
+            await asyncio.gather(*tasks, return_exceptions=True)
             
         return True
 
@@ -267,40 +402,128 @@ class MarketDataManager:
                     try:
                         candles = await self.db.get_candles(symbol, tf, limit=limit)
                         if candles:
-                            df = pd.DataFrame(candles, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-                            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-                            self.data_store[key] = df
+                            # Allocate the ring once on first load; update_data() extends it in place
+                            arr = np.asarray(candles, dtype=np.float64)
+                            ring = CandleRing(MAX_CANDLES)
+                            ring.extend(arr[:, 0].astype(np.int64), arr[:, 1:6])
+                            self._rings[key] = ring
+                            self.data_store[key] = ring.frame()
+                            self._last_access[key] = time.time()
+                            self._last_saved_ts[key] = int(ring.ts[ring.size - 1])
                             loaded += 1
                     except Exception as e:
                         self.logger.error(f"Error loading {key} from DB: {e}")
         self.logger.info(f"✅ Loaded {loaded} datasets from SQLite cache")
 
     def get_data(self, symbol, timeframe, exchange='BINANCE'):
-        return self.data_store.get(f"{exchange}_{symbol}_{timeframe}")
+        """
+        Raw OHLCV frame for a key. Ring-backed frames are live views that are updated in place
+        by update_data()/update_tickers(): treat the result as a snapshot for the current cycle
+        and copy it if it must survive across cycles.
+        """
+        key = f"{exchange}_{symbol}_{timeframe}"
+        df = self.data_store.get(key)
+        if df is not None:
+            self._last_access[key] = time.time()
+        return df
+
+    def get_ohlcv_arrays(self, symbol, timeframe, exchange='BINANCE') -> Optional[tuple]:
+        """
+        Column arrays (ts ms int64, open, high, low, close, volume float64) for a key, or None.
+        These are zero-copy views into the candle ring (strided: use np.ascontiguousarray
+        if a kernel needs contiguous input) and carry the same live-view caveat as get_data().
+        """
+        key = f"{exchange}_{symbol}_{timeframe}"
+        df = self.data_store.get(key)
+        if df is None or df.empty:
+            return None
+        self._last_access[key] = time.time()
+        ring = self._get_ring(key)
+        if not ring.backs(df):
+            # Frame was set externally: adopt the rebuilt ring so later calls stay zero-copy
+            self.data_store[key] = ring.frame()
+        return ring.arrays()
 
     def validate_data(self, df, symbol, timeframe):
         if df is None or df.empty: return False, "Empty DataFrame"
-        required_cols = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
-        if not all(col in df.columns for col in required_cols): return False, "Missing columns"
-        if df.tail(5)['close'].isnull().any(): return False, "NaN in recent close"
+        if not REQUIRED_COLS.issubset(df.columns): return False, "Missing columns"
+        # ndarray view of the last 5 closes: no tail()/isnull() intermediate frames
+        close_tail = df['close'].to_numpy(dtype=np.float64, na_value=np.nan)[-5:]
+        if np.isnan(close_tail).any(): return False, "NaN in recent close"
         return True, "OK"
 
+    def _cached_features(self, key: str) -> Optional[pd.DataFrame]:
+        cached = self.features_cache.get(key)
+        if cached is not None:
+            self.features_cache.move_to_end(key)
+            self._last_access[key] = time.time()
+        return cached
+
+    def _features_lock(self, key: str) -> threading.Lock:
+        with self._features_locks_guard:
+            return self._features_locks.setdefault(key, threading.Lock())
+
     def get_data_with_features(self, symbol, timeframe, exchange='BINANCE'):
         key = f"{exchange}_{symbol}_{timeframe}"
-        if key in self.features_cache: return self.features_cache[key]
+        cached = self._cached_features(key)
+        if cached is not None:
+            return cached
         
-        df = self.data_store.get(key)
-        is_valid, reason = self.validate_data(df, symbol, timeframe)
-        if not is_valid: return None
-        
-        try:
-            fe = self._get_feature_engineer()
-            df_with_features = fe.calculate_features(df.copy())
-            self.features_cache[key] = df_with_features
-            return df_with_features
-        except Exception as e:
-            self.logger.error(f"[{symbol} {timeframe}] Feature calculation failed: {e}")
-            return None
+        # Coalesce concurrent misses (executor threads) so only one caller runs FeatureEngineer per key
+        with self._features_lock(key):
+            cached = self._cached_features(key)
+            if cached is not None:
+                return cached
+            
+            df = self.data_store.get(key)
+            is_valid, reason = self.validate_data(df, symbol, timeframe)
+            if not is_valid: return None
+            
+            try:
+                fe = self._get_feature_engineer()
+                # FeatureEngineer only reassigns whole columns (to_numeric) and concats new ones,
+                # so a shallow copy protects data_store without duplicating the OHLCV buffers.
+                df_with_features = fe.calculate_features(df.copy(deep=False))
+                self.features_cache[key] = df_with_features
+                self._last_access[key] = time.time()
+                if len(self.features_cache) > FEATURES_CACHE_CAPACITY:
+                    self.features_cache.popitem(last=False)
+                return df_with_features
+            except Exception as e:
+                self.logger.error(f"[{symbol} {timeframe}] Feature calculation failed: {e}")
+                return None
+
+    def _get_ring(self, key: str) -> CandleRing:
+        """Return the ring backing data_store[key], rebuilding it if the frame was replaced externally."""
+        ring = self._rings.get(key)
+        stored = self.data_store.get(key)
+        if ring is None or not ring.backs(stored):
+            ring = CandleRing(MAX_CANDLES)
+            if stored is not None and not stored.empty:
+                ring.extend_frame(stored)
+            self._rings[key] = ring
+        return ring
+
+    def _evict_idle_keys(self, now: float):
+        """Drop data_store keys (and their ring/feature/sync state) that nobody has read or written recently."""
+        stale = []
+        for key in list(self.data_store.keys()):
+            tf = key.rsplit('_', 1)[-1]
+            ttl = max(DATA_STORE_IDLE_TTL, 2 * self._get_timeframe_seconds(tf))
+            if now - self._last_access.get(key, now) > ttl:
+                stale.append(key)
+            else:
+                self._last_access.setdefault(key, now)
+        for key in stale:
+            self.data_store.pop(key, None)
+            self._rings.pop(key, None)
+            self.features_cache.pop(key, None)
+            self._ohlcv_sync_state.pop(key, None)
+            self._last_access.pop(key, None)
+            self._last_saved_ts.pop(key, None)
+            self._features_locks.pop(key, None)
+        if stale:
+            self.logger.info(f"💾 Evicted {len(stale)} idle OHLCV datasets from memory.")
 
     def _get_timeframe_seconds(self, timeframe: str) -> int:
         unit = timeframe[-1]
@@ -314,17 +537,12 @@ class MarketDataManager:
     def _patch_current_candle(self, df: pd.DataFrame, last_price: float) -> pd.DataFrame:
         """Patch the last row of the candle with the current price, updating high/low extremes."""
         if df is None or df.empty: return df
-        last_idx = -1
-        # Use col index for safety
-        col_close = df.columns.get_loc('close')
-        col_high = df.columns.get_loc('high')
-        col_low = df.columns.get_loc('low')
-        
-        df.iloc[last_idx, col_close] = last_price
-        if last_price > df.iloc[last_idx, col_high]:
-            df.iloc[last_idx, col_high] = last_price
-        if last_price < df.iloc[last_idx, col_low]:
-            df.iloc[last_idx, col_low] = last_price
+        # Fixed OHLCV_COLS layout: positional iat avoids column-index hashing on every tick
+        df.iat[-1, CLOSE_IDX] = last_price
+        if last_price > df.iat[-1, HIGH_IDX]:
+            df.iat[-1, HIGH_IDX] = last_price
+        if last_price < df.iat[-1, LOW_IDX]:
+            df.iat[-1, LOW_IDX] = last_price
         return df
 
     def _should_fetch_new_candle(self, name: str, symbol: str, timeframe: str, adapter: Any) -> bool:
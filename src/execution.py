@@ -7,6 +7,7 @@ import tempfile
 import asyncio
 import numpy as np
 from datetime import datetime
+from typing import Optional, Tuple, Dict, List, Any
 
 from src import config
 from src.infrastructure.notifications.notification import (
@@ -3,9 +3,20 @@ import logging
 import asyncio
 import aiosqlite
 import json
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Any
 
+# Read-only connections served to SELECT paths; WAL lets them run alongside the single writer
+READER_POOL_SIZE = max(2, min(4, os.cpu_count() or 2))
+# Per-connection tuning applied to the writer and every reader
+CONNECTION_PRAGMAS = (
+    "PRAGMA busy_timeout = 5000",
+    "PRAGMA cache_size = -65536",        # 64MB page cache (candle range scans)
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",      # 256MB memory-mapped reads
+)
+
 class DataManager:
     """
     Singleton Async SQLite Database Manager.
@@ -18,7 +29,8 @@ class DataManager:
         """Private init - use get_instance() instead."""
         self.db_path = db_path
         self.logger = logging.getLogger("DataManager")
-        self._db = None
+        self._db = None          # Writer connection (all writes go through _write_lock)
+        self._readers = None     # asyncio.Queue of read-only connections, filled by initialize()
         self._write_lock = asyncio.Lock()
 
     @classmethod
@@ -55,11 +67,16 @@ class DataManager:
         schema_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "schema.sql")
         
         self._db = await aiosqlite.connect(self.db_path, timeout=30)
-        await self._db.execute("PRAGMA busy_timeout = 5000")
+        # Autocommit mode: the write helpers open explicit BEGIN IMMEDIATE transactions themselves
+        self._db.isolation_level = None
+        await self._apply_pragmas(self._db)
         self._db.row_factory = aiosqlite.Row
+        # page_size only takes effect on a fresh file, and must be set before switching to WAL
+        await self._db.execute("PRAGMA page_size = 8192")
         # Enable Write-Ahead Logging for better concurrency
         await self._db.execute("PRAGMA journal_mode=WAL")
         await self._db.execute("PRAGMA synchronous=NORMAL")
+        await self._db.execute("PRAGMA wal_autocheckpoint = 1000")
         # Enable Foreign Keys
         await self._db.execute("PRAGMA foreign_keys=ON")
         
@@ -187,20 +204,66 @@ class DataManager:
         else:
             self.logger.error(f"Schema file not found at {schema_path}")
 
+        await self._open_readers()
+
+    @staticmethod
+    async def _apply_pragmas(conn):
+        # No cache=shared: each connection keeps its own page cache under WAL
+        for pragma in CONNECTION_PRAGMAS:
+            await conn.execute(pragma)
+
+    async def _open_readers(self):
+        """Open the read-only connection pool (skipped for in-memory DBs, which cannot be shared)."""
+        if self._readers is not None or self.db_path == ':memory:':
+            return
+        readers = asyncio.Queue()
+        for _ in range(READER_POOL_SIZE):
+            conn = await aiosqlite.connect(self.db_path, timeout=30)
+            conn.row_factory = aiosqlite.Row
+            await self._apply_pragmas(conn)
+            await conn.execute("PRAGMA query_only = 1")
+            readers.put_nowait(conn)
+        self._readers = readers
+
+    @asynccontextmanager
+    async def _acquire_reader(self):
+        """Borrow a read-only connection; falls back to the writer when no pool is open."""
+        db = await self.get_db()
+        readers = self._readers
+        if readers is None:
+            yield db
+            return
+        conn = await readers.get()
+        try:
+            yield conn
+        finally:
+            readers.put_nowait(conn)
+
     async def _execute_write(self, sql: str, params: tuple = ()):
         """Internal helper to execute and commit with a lock."""
         db = await self.get_db()
         async with self._write_lock:
-            cursor = await db.execute(sql, params)
-            await db.commit()
+            # Take the RESERVED lock up front instead of upgrading mid-statement (avoids SQLITE_BUSY)
+            await db.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = await db.execute(sql, params)
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
             return cursor
 
     async def _execute_write_many(self, sql: str, data: list):
         """Internal helper for executemany with a lock."""
         db = await self.get_db()
         async with self._write_lock:
-            cursor = await db.executemany(sql, data)
-            await db.commit()
+            await db.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = await db.executemany(sql, data)
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
             return cursor
 
     async def get_db(self):
@@ -210,7 +273,11 @@ class DataManager:
         return self._db
 
     async def close(self):
-        """Close DB connection."""
+        """Close the writer and every pooled reader."""
+        readers, self._readers = self._readers, None
+        if readers is not None:
+            while not readers.empty():
+                await readers.get_nowait().close()
         if self._db:
             await self._db.close()
             self._db = None
@@ -220,11 +287,10 @@ class DataManager:
     # ------------------------------------------------------------------------
     async def get_profiles(self) -> List[dict]:
         """Get all active profiles."""
-        db = await self.get_db()
-        db.row_factory = aiosqlite.Row
-        async with db.execute("SELECT * FROM profiles WHERE is_active = 1") as cursor:
-            rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
+        async with self._acquire_reader() as db:
+            async with db.execute("SELECT * FROM profiles WHERE is_active = 1") as cursor:
+                rows = await cursor.fetchall()
+                return [dict(row) for row in rows]
 
     async def add_profile(self, name: str, env: str, exchange: str, label: str="", api_key: str="", api_secret: str="", color: str="white") -> int:
         """Add a new profile or return existing ID."""
@@ -247,20 +313,19 @@ class DataManager:
 
     async def get_trade_by_order_id(self, order_id: str) -> Optional[dict]:
         """Fetch a trade by its exchange_order_id or client_order_id."""
-        db = await self.get_db()
-        db.row_factory = aiosqlite.Row
-        async with db.execute("""
-            SELECT * FROM trades 
-            WHERE (exchange_order_id = ? OR exchange_order_id = ?) 
-            ORDER BY id DESC LIMIT 1
-        """, (order_id, order_id)) as cursor:
-            row = await cursor.fetchone()
-            if row:
-                d = dict(row)
-                if d.get('meta_json'):
-                    d['meta'] = json.loads(d['meta_json'])
-                return d
-            return None
+        async with self._acquire_reader() as db:
+            async with db.execute("""
+                SELECT * FROM trades 
+                WHERE (exchange_order_id = ? OR exchange_order_id = ?) 
+                ORDER BY id DESC LIMIT 1
+            """, (order_id, order_id)) as cursor:
+                row = await cursor.fetchone()
+                if row:
+                    d = dict(row)
+                    if d.get('meta_json'):
+                        d['meta'] = json.loads(d['meta_json'])
+                    return d
+                return None
 
     # ------------------------------------------------------------------------
     # TRADES CRUD
@@ -351,33 +416,32 @@ class DataManager:
 
     async def get_daily_realized_pnl(self, profile_id: int) -> float:
         """Calculate sum of PnL for trades closed today (since 00:00 UTC)."""
-        db = await self.get_db()
         # Start of day in ms
         today_start_ms = int(datetime.now().replace(hour=0, minute=0, second=0, microsecond=0).timestamp() * 1000)
         
-        async with db.execute("""
-            SELECT SUM(pnl) FROM trades 
-            WHERE profile_id = ? AND status = 'CLOSED' AND exit_time >= ?
-        """, (profile_id, today_start_ms)) as cursor:
-            row = await cursor.fetchone()
-            return float(row[0] or 0.0)
+        async with self._acquire_reader() as db:
+            async with db.execute("""
+                SELECT SUM(pnl) FROM trades 
+                WHERE profile_id = ? AND status = 'CLOSED' AND exit_time >= ?
+            """, (profile_id, today_start_ms)) as cursor:
+                row = await cursor.fetchone()
+                return float(row[0] or 0.0)
 
     async def get_active_positions(self, profile_id: int) -> List[dict]:
         """Fetch all ACTIVE or OPENED positions for a specific profile."""
-        db = await self.get_db()
-        db.row_factory = aiosqlite.Row
-        async with db.execute("""
-            SELECT * FROM trades 
-            WHERE profile_id = ? AND status IN ('ACTIVE', 'OPENED', 'PENDING')
-        """, (profile_id,)) as cursor:
-            rows = await cursor.fetchall()
-            result = []
-            for r in rows:
-                d = dict(r)
-                if d.get('meta_json'):
-                    d['meta'] = json.loads(d['meta_json'])
-                result.append(d)
-            return result
+        async with self._acquire_reader() as db:
+            async with db.execute("""
+                SELECT * FROM trades 
+                WHERE profile_id = ? AND status IN ('ACTIVE', 'OPENED', 'PENDING')
+            """, (profile_id,)) as cursor:
+                rows = await cursor.fetchall()
+                result = []
+                for r in rows:
+                    d = dict(r)
+                    if d.get('meta_json'):
+                        d['meta'] = json.loads(d['meta_json'])
+                    result.append(d)
+                return result
 
 
     async def insert_trade_history(self, trade_data: dict) -> int:
@@ -386,21 +450,20 @@ class DataManager:
 
     async def get_trade_history(self, profile_id: int, limit: int = 100) -> List[dict]:
         """Fetch closed/cancelled trade history for a profile."""
-        db = await self.get_db()
-        db.row_factory = aiosqlite.Row
-        async with db.execute("""
-            SELECT * FROM trades 
-            WHERE profile_id = ? AND status IN ('CLOSED', 'CANCELLED')
-            ORDER BY exit_time DESC LIMIT ?
-        """, (profile_id, limit)) as cursor:
-            rows = await cursor.fetchall()
-            result = []
-            for r in rows:
-                d = dict(r)
-                if d.get('meta_json'):
-                    d['meta'] = json.loads(d['meta_json'])
-                result.append(d)
-            return result
+        async with self._acquire_reader() as db:
+            async with db.execute("""
+                SELECT * FROM trades 
+                WHERE profile_id = ? AND status IN ('CLOSED', 'CANCELLED')
+                ORDER BY exit_time DESC LIMIT ?
+            """, (profile_id, limit)) as cursor:
+                rows = await cursor.fetchall()
+                result = []
+                for r in rows:
+                    d = dict(r)
+                    if d.get('meta_json'):
+                        d['meta'] = json.loads(d['meta_json'])
+                    result.append(d)
+                return result
 
     # ------------------------------------------------------------------------
     # AI TRAINING LOGS
@@ -439,21 +502,21 @@ class DataManager:
 
     async def get_candles(self, symbol: str, timeframe: str, limit: int = 100) -> List[List]:
         """Fetch candles from cache and update last_used_at."""
-        db = await self.get_db()
-        await db.execute("""
+        # The touch goes through the writer (committed) so the read itself can use the reader pool
+        await self._execute_write("""
             UPDATE ohlcv_cache SET last_used_at = ? 
             WHERE symbol = ? AND timeframe = ?
         """, (int(datetime.now().timestamp()), symbol, timeframe))
-        # Commit not strictly required immediately but good practice
         
-        async with db.execute("""
-            SELECT timestamp, open, high, low, close, volume 
-            FROM ohlcv_cache 
-            WHERE symbol = ? AND timeframe = ?
-            ORDER BY timestamp ASC LIMIT ?
-        """, (symbol, timeframe, limit)) as cursor:
-            rows = await cursor.fetchall()
-            return [list(r) for r in rows]
+        async with self._acquire_reader() as db:
+            async with db.execute("""
+                SELECT timestamp, open, high, low, close, volume 
+                FROM ohlcv_cache 
+                WHERE symbol = ? AND timeframe = ?
+                ORDER BY timestamp ASC LIMIT ?
+            """, (symbol, timeframe, limit)) as cursor:
+                rows = await cursor.fetchall()
+                return [list(r) for r in rows]
 
     async def purge_old_candles(self, days: int = 30):
         """Cleanup old unused candles."""
@@ -465,13 +528,13 @@ class DataManager:
     # ------------------------------------------------------------------------
     async def get_risk_metric(self, profile_id: int, metric_name: str, env: str) -> Optional[float]:
         """Retrieve a specific risk metric (e.g. 'peak_balance')."""
-        db = await self.get_db()
-        async with db.execute("""
-            SELECT value FROM risk_metrics 
-            WHERE profile_id = ? AND environment = ? AND metric_name = ?
-        """, (profile_id, env, metric_name)) as cursor:
-            row = await cursor.fetchone()
-            return row[0] if row else None
+        async with self._acquire_reader() as db:
+            async with db.execute("""
+                SELECT value FROM risk_metrics 
+                WHERE profile_id = ? AND environment = ? AND metric_name = ?
+            """, (profile_id, env, metric_name)) as cursor:
+                row = await cursor.fetchone()
+                return row[0] if row else None
 
     async def set_risk_metric(self, profile_id: int, metric_name: str, value: float, env: str):
         """Set a risk metric asynchronously."""
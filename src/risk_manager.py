@@ -3,6 +3,7 @@ import os
 import sys
 import logging
 from datetime import datetime
+from typing import Optional, Tuple
 
 from src import config
 from src.domain.services.risk_service import RiskService
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+OHLCV Disk I/O Utility
+Single place for reading and writing historical candle files.
+Parquet (binary, typed, compressed) is used when requested and pyarrow is installed;
+CSV remains the default so existing data folders keep working.
+"""
+import os
+from typing import Optional
+
+import pandas as pd
+
+from .time_helper import ensure_datetime
+
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+OHLCV_EXTENSIONS = ('.parquet', '.csv')
+
+def resolve_ohlcv_path(base_path: str) -> Optional[str]:
+    """
+    Find an existing candle file for a path without extension.
+    Prefers Parquet over CSV when both exist.
+    
+    Args:
+        base_path (str): e.g. 'data/BINANCE_BTCUSDT_1h'
+        
+    Returns:
+        Optional[str]: Full file path, or None if neither file exists.
+    """
+    for ext in OHLCV_EXTENSIONS:
+        path = base_path + ext
+        if os.path.exists(path):
+            return path
+    return None
+
+def read_ohlcv(path: str) -> pd.DataFrame:
+    """Load a candle file; Parquet keeps datetime64 so no timestamp parsing is needed."""
+    if path.endswith('.parquet'):
+        df = pd.read_parquet(path, engine='pyarrow')
+    else:
+        df = pd.read_csv(path)
+    if 'timestamp' in df.columns:
+        df['timestamp'] = ensure_datetime(df['timestamp'])
+    return df
+
+def write_ohlcv(df: pd.DataFrame, base_path: str, fmt: str = 'csv') -> str:
+    """
+    Persist candles as Parquet (zstd) when fmt='parquet' and pyarrow is available, else CSV.
+    
+    Returns:
+        str: The file path written.
+    """
+    if fmt == 'parquet' and HAS_PYARROW:
+        path = base_path + '.parquet'
+        df.to_parquet(path, engine='pyarrow', compression='zstd', index=False)
+    else:
+        path = base_path + '.csv'
+        df.to_csv(path, index=False)
+    return path
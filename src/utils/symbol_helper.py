@@ -2,8 +2,11 @@
 """
 Symbol Helper Utility
 Centralizes symbol normalization and formatting logic for all exchanges.
+Conversions are pure and called per symbol on every cycle, so results are memoized.
 """
+from functools import lru_cache
 
+@lru_cache(maxsize=4096)
 def to_api_format(symbol: str) -> str:
     """
     Standardize CCXT symbol for exchange API calls and file paths.
@@ -20,6 +23,7 @@ def to_api_format(symbol: str) -> str:
     base = symbol.split(':')[0]
     return base.replace('/', '').upper()
 
+@lru_cache(maxsize=4096)
 def to_raw_format(symbol: str) -> str:
     """
     Standardize symbol to raw format (no separators, all upper).
@@ -38,6 +42,7 @@ def to_raw_format(symbol: str) -> str:
     base = symbol.split(':')[0]
     return base.replace('/', '').replace('-', '').replace('_', '').upper()
 
+@lru_cache(maxsize=4096)
 def to_display_format(symbol: str) -> str:
     """
     Standardize symbol for display/notifications.
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+Time Helper Utility
+Centralizes OHLCV timestamp coercion so load paths skip redundant parsing.
+"""
+import numpy as np
+import pandas as pd
+
+def ensure_datetime(col: pd.Series) -> pd.Series:
+    """
+    Convert an OHLCV 'timestamp' column to datetime64 using the cheapest path.
+    - Already datetime64 (e.g. DB/ring frames): returned unchanged.
+    - Integer epoch milliseconds (exchange/SQLite): reinterpreted via numpy, no parsing.
+    - Strings (CSV): parsed once with the vectorized ISO8601 fast path.
+    
+    Args:
+        col (pd.Series): Raw timestamp column.
+        
+    Returns:
+        pd.Series: datetime64 column aligned to the input index.
+    """
+    dtype = col.dtype
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return col
+    if pd.api.types.is_integer_dtype(dtype):
+        return pd.Series(col.to_numpy(dtype=np.int64).astype('datetime64[ms]'), index=col.index, name=col.name)
+    if pd.api.types.is_float_dtype(dtype):
+        return pd.to_datetime(col, unit='ms')
+    return pd.to_datetime(col, format='ISO8601')
@@ -5,7 +5,7 @@ import time
 import asyncio
 from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, AsyncMock, patch
-from src.data_manager import MarketDataManager
+from src.data_manager import MarketDataManager, CandleRing, FETCH_CONCURRENCY
 from src.infrastructure.repository.database import DataManager
 
 class TestDataManager:
@@ -68,6 +68,7 @@ class TestDataManager:
         assert f"BINANCE_{symbol}_{tf}" in mdm.data_store
         candles = await db.get_candles(symbol, tf)
         assert len(candles) >= 1
+        assert candles[0] == [1704067200000, 50000.0, 50100.0, 49900.0, 50050.0, 10.0]
 
     @pytest.mark.asyncio
     async def test_concurrent_writes_protection(self, db):
@@ -402,3 +403,251 @@ class TestMarketDataManagerSync:
         with patch("src.data_manager.time.time", return_value=time.time() + 3):
             await mdm.fetch_ticker(symbol)
             assert mock_adapter.fetch_ticker.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_update_data_timeframe_failure_isolated(self, mdm, mock_adapter):
+        """
+        [RESILIENCE] A failing timeframe must not block the other timeframes of the same symbol.
+        """
+        symbol = "BTC/USDT"
+        ohlcv = [[1704067200000, 50000, 50100, 49900, 50050, 10]]
+
+        async def fetch(sym, tf, limit=50):
+            if tf == "1h":
+                raise Exception("Network Timeout")
+            return ohlcv
+        mock_adapter.fetch_ohlcv = AsyncMock(side_effect=fetch)
+
+        with patch("src.config.BINANCE_SYMBOLS", [symbol]):
+            await mdm.update_data([symbol], ["1h", "4h"], force=True)
+
+        assert f"BINANCE_{symbol}_4h" in mdm.data_store
+        assert f"BINANCE_{symbol}_1h" not in mdm.data_store
+
+    def test_candle_ring_replaces_overlap_and_caps(self):
+        """[HAPPY PATH] Overlapping candles are replaced by the fresh fetch and history is capped."""
+        ts = pd.date_range('2024-01-01', periods=5, freq='h')
+        old_df = pd.DataFrame({'timestamp': ts, 'open': 1.0, 'high': 1.0, 'low': 1.0, 'close': [1.0, 2.0, 3.0, 4.0, 5.0], 'volume': 1.0})
+        new_ts = pd.date_range(ts[3], periods=3, freq='h')
+        new_df = pd.DataFrame({'timestamp': new_ts, 'open': 1.0, 'high': 1.0, 'low': 1.0, 'close': [40.0, 50.0, 60.0], 'volume': 1.0})
+
+        ring = CandleRing(capacity=4)
+        ring.extend_frame(old_df)
+        buf_id = id(ring.buf)
+        ring.extend_frame(new_df)
+        merged = ring.frame()
+
+        assert merged['close'].tolist() == [3.0, 40.0, 50.0, 60.0]
+        assert merged['timestamp'].is_monotonic_increasing
+        assert merged['timestamp'].iloc[-1] == new_ts[-1]
+        assert id(ring.buf) == buf_id  # No reallocation
+
+    @pytest.mark.asyncio
+    async def test_update_data_patches_share_ring_buffer(self, mdm, mock_adapter):
+        """[STATE MUTATION] Ticker patches on the stored frame land in the backing ring buffer."""
+        symbol = "BTC/USDT"
+        key = f"BINANCE_{symbol}_1h"
+        with patch("src.config.BINANCE_SYMBOLS", [symbol]):
+            await mdm.update_data([symbol], ["1h"], force=True)
+
+        df = mdm.data_store[key]
+        mdm._patch_current_candle(df, 51000.0)
+
+        ring = mdm._rings[key]
+        assert ring.backs(df)
+        assert ring.buf[ring.size - 1, 3] == 51000.0
+
+    @pytest.mark.asyncio
+    async def test_update_tickers_patches_ring_in_place(self, mdm, mock_adapter):
+        """[STATE MUTATION] Ticker bridging on a ring-backed key keeps the same frame object."""
+        symbol = "BTC/USDT"
+        key = f"BINANCE_{symbol}_1h"
+        with patch("src.config.BINANCE_SYMBOLS", [symbol]):
+            await mdm.update_data([symbol], ["1h"], force=True)
+            df_before = mdm.data_store[key]
+            mock_adapter.fetch_tickers = AsyncMock(return_value={symbol: {'last': 50500.0}})
+            mdm._last_ticker_update = 0
+            await mdm.update_tickers([symbol])
+
+        assert mdm.data_store[key] is df_before
+        assert df_before.iloc[-1]['close'] == 50500.0
+        assert df_before.iloc[-1]['high'] == 50500.0
+
+    def test_get_data_with_features_leaves_store_untouched(self, mdm, sample_df):
+        """[ISOLATION] Feature calculation must not add or replace columns on the stored frame."""
+        key = "BINANCE_BTC/USDT_1h"
+        mdm.data_store[key] = sample_df
+        mock_fe = MagicMock()
+        def calc(df):
+            df['close'] = df['close'] * 0  # Simulate FE column reassignment
+            df['rsi'] = 50.0
+            return df
+        mock_fe.calculate_features = MagicMock(side_effect=calc)
+        mdm._feature_engineer = mock_fe
+
+        mdm.get_data_with_features("BTC/USDT", "1h", "BINANCE")
+
+        assert 'rsi' not in mdm.data_store[key].columns
+        assert mdm.data_store[key]['close'].iloc[-1] == 50150.0
+
+    def test_features_cache_lru_cap(self, mdm, sample_df):
+        """[EDGE CASE] features_cache evicts the least recently used entry beyond capacity."""
+        mock_fe = MagicMock()
+        mock_fe.calculate_features = MagicMock(side_effect=lambda df: df)
+        mdm._feature_engineer = mock_fe
+        for sym in ("A/USDT", "B/USDT", "C/USDT"):
+            mdm.data_store[f"BINANCE_{sym}_1h"] = sample_df
+
+        with patch("src.data_manager.FEATURES_CACHE_CAPACITY", 2):
+            mdm.get_data_with_features("A/USDT", "1h")
+            mdm.get_data_with_features("B/USDT", "1h")
+            mdm.get_data_with_features("A/USDT", "1h")  # Touch A -> B becomes LRU
+            mdm.get_data_with_features("C/USDT", "1h")
+
+        assert list(mdm.features_cache.keys()) == ["BINANCE_A/USDT_1h", "BINANCE_C/USDT_1h"]
+
+    def test_evict_idle_keys_drops_untouched_data(self, mdm, sample_df):
+        """[STATE MUTATION] Keys idle beyond the TTL are removed together with their derived state."""
+        now = time.time()
+        mdm.data_store["BINANCE_OLD/USDT_1h"] = sample_df
+        mdm.data_store["BINANCE_NEW/USDT_1h"] = sample_df
+        mdm.features_cache["BINANCE_OLD/USDT_1h"] = sample_df
+        mdm._last_access["BINANCE_OLD/USDT_1h"] = now - 7 * 3600
+        mdm._last_access["BINANCE_NEW/USDT_1h"] = now
+
+        mdm._evict_idle_keys(now)
+
+        assert "BINANCE_OLD/USDT_1h" not in mdm.data_store
+        assert "BINANCE_OLD/USDT_1h" not in mdm.features_cache
+        assert "BINANCE_NEW/USDT_1h" in mdm.data_store
+
+    @pytest.mark.parametrize("closes,expected", [
+        ([1.0, 2.0, 3.0], True),
+        ([1.0, np.nan, 3.0], False),
+        ([np.nan] + [1.0] * 6, True),  # NaN outside the last 5 candles is tolerated
+        ([1.0, None, 3.0], False),
+    ])
+    def test_validate_data_recent_nan(self, mdm, closes, expected):
+        """[EDGE CASE] Only NaN/None within the last 5 closes invalidates the frame."""
+        n = len(closes)
+        df = pd.DataFrame({'timestamp': pd.date_range('2024-01-01', periods=n, freq='h'),
+                           'open': 1.0, 'high': 1.0, 'low': 1.0, 'close': closes, 'volume': 1.0})
+        assert mdm.validate_data(df, "BTC/USDT", "1h")[0] is expected
+
+    def test_validate_data_missing_columns(self, mdm, sample_df):
+        """[INVALID INPUT] Frames without the OHLCV schema are rejected."""
+        is_valid, reason = mdm.validate_data(sample_df.drop(columns=['volume']), "BTC/USDT", "1h")
+        assert is_valid is False and reason == "Missing columns"
+
+    def test_singleton_thread_safe_construction(self, mock_adapter):
+        """[CONCURRENCY] Concurrent construction from threads yields one fully initialized instance."""
+        from concurrent.futures import ThreadPoolExecutor
+        MarketDataManager._instance = None
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            instances = list(pool.map(lambda _: MarketDataManager(db=None, adapters={"BINANCE": mock_adapter}), range(16)))
+        assert all(inst is instances[0] for inst in instances)
+        assert instances[0].initialized and instances[0].adapter is mock_adapter
+        MarketDataManager._instance = None
+
+    @pytest.mark.asyncio
+    async def test_update_data_rejects_nan_close(self, mdm, mock_adapter):
+        """[INVALID INPUT] Fetched candles with a missing recent close are not stored."""
+        symbol = "BTC/USDT"
+        mock_adapter.fetch_ohlcv = AsyncMock(return_value=[[1704067200000, 50000, 50100, 49900, None, 10]])
+        with patch("src.config.BINANCE_SYMBOLS", [symbol]):
+            await mdm.update_data([symbol], ["1h"], force=True)
+        assert f"BINANCE_{symbol}_1h" not in mdm.data_store
+
+    @pytest.mark.asyncio
+    async def test_update_data_reuses_frame_when_ring_full(self, mdm, mock_adapter):
+        """[PERFORMANCE] Once the ring is full, new candles shift in place and the stored frame object is kept."""
+        symbol = "BTC/USDT"
+        key = f"BINANCE_{symbol}_1h"
+        hour = 3600 * 1000
+        base = 1704067200000
+        with patch("src.data_manager.MAX_CANDLES", 3), patch("src.config.BINANCE_SYMBOLS", [symbol]):
+            mock_adapter.fetch_ohlcv = AsyncMock(return_value=[[base + i * hour, 1, 2, 0.5, 1.0 + i, 1] for i in range(3)])
+            await mdm.update_data([symbol], ["1h"], force=True)
+            first = mdm.data_store[key]
+
+            mdm._ohlcv_sync_state[key] = 0
+            mdm._stagger_index = 0
+            mock_adapter.fetch_ohlcv = AsyncMock(return_value=[[base + 3 * hour, 1, 2, 0.5, 9.0, 1]])
+            await mdm.update_data([symbol], ["1h"], force=True)
+
+        assert mdm.data_store[key] is first
+        assert first['close'].tolist() == [2.0, 3.0, 9.0]
+
+    def test_throttle_sized_from_adapter_rate_limit(self, mdm):
+        """[HAPPY PATH] Each exchange gets its own throttle sized from the ccxt rateLimit; unknown limits fall back."""
+        slow = MagicMock()
+        slow.exchange.rateLimit = 1000
+        semaphore, spacing = mdm._get_throttle("BYBIT", slow)
+        assert semaphore._value == 1
+        assert spacing == 1.0
+        assert mdm._get_throttle("BYBIT", slow)[0] is semaphore
+
+        fast = MagicMock()
+        fast.exchange.rateLimit = 50
+        assert mdm._get_throttle("FAST", fast)[0]._value == FETCH_CONCURRENCY
+
+        semaphore, spacing = mdm._get_throttle("BINANCE", MagicMock())
+        assert semaphore._value == FETCH_CONCURRENCY
+        assert spacing == 0.0
+
+    def test_get_ohlcv_arrays_are_ring_views(self, mdm, sample_df):
+        """[HAPPY PATH] get_ohlcv_arrays returns zero-copy column views into the ring backing the key."""
+        key = "BINANCE_BTC/USDT_1h"
+        mdm.data_store[key] = sample_df
+        ts, o, h, l, c, v = mdm.get_ohlcv_arrays("BTC/USDT", "1h")
+
+        ring = mdm._rings[key]
+        assert mdm.data_store[key] is ring.frame()
+        assert np.shares_memory(c, ring.buf)
+        assert c.tolist() == sample_df['close'].tolist()
+        assert ts[-1] == sample_df['timestamp'].iloc[-1].value // 10**6
+
+        ring.patch_last(99999.0)
+        assert c[-1] == 99999.0
+        assert mdm.get_ohlcv_arrays("ETH/USDT", "1h") is None
+
+    @pytest.mark.asyncio
+    async def test_update_data_persists_only_delta(self, mdm, mock_adapter):
+        """[PERFORMANCE] Re-fetched candles already in SQLite are skipped; the previously live candle is re-saved."""
+        symbol = "BTC/USDT"
+        key = f"BINANCE_{symbol}_1h"
+        hour = 3600 * 1000
+        base = 1704067200000
+        mdm.db.upsert_candles = AsyncMock()
+        with patch("src.config.BINANCE_SYMBOLS", [symbol]):
+            mock_adapter.fetch_ohlcv = AsyncMock(return_value=[[base + i * hour, 1, 2, 0.5, 1.0 + i, 1] for i in range(3)])
+            await mdm.update_data([symbol], ["1h"], force=True)
+
+            mdm._ohlcv_sync_state[key] = 0
+            mdm._stagger_index = 0
+            mock_adapter.fetch_ohlcv = AsyncMock(return_value=[[base + i * hour, 1, 2, 0.5, 5.0 + i, 1] for i in range(1, 5)])
+            await mdm.update_data([symbol], ["1h"], force=True)
+
+        assert len(mdm.db.upsert_candles.call_args_list[0].args[2]) == 3
+        saved = mdm.db.upsert_candles.call_args_list[1].args[2]
+        assert [c[0] for c in saved] == [base + 2 * hour, base + 3 * hour, base + 4 * hour]
+        assert mdm._last_saved_ts[key] == base + 4 * hour
+
+    def test_get_data_with_features_coalesces_concurrent_misses(self, mdm, sample_df):
+        """[CONCURRENCY] Concurrent threads missing the cache for one key run FeatureEngineer only once."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        def slow_features(df):
+            time.sleep(0.05)
+            return df
+
+        mock_fe = MagicMock()
+        mock_fe.calculate_features = MagicMock(side_effect=slow_features)
+        mdm._feature_engineer = mock_fe
+        mdm.data_store["BINANCE_BTC/USDT_1h"] = sample_df
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: mdm.get_data_with_features("BTC/USDT", "1h"), range(4)))
+
+        assert mock_fe.calculate_features.call_count == 1
+        assert all(r is results[0] for r in results)
@@ -159,3 +159,40 @@ async def test_idempotent_upsert():
     res = await db.get_candles('ETHUSDT', '1h')
     assert len(res) == 1  # Should only be one record due to PRIMARY KEY
     await db.close()
+
+@pytest.mark.asyncio
+async def test_reader_pool_is_read_only():
+    db_path = get_test_db_path()
+    db = DataManager(db_path)
+    await db.initialize()
+    assert db._readers.qsize() > 0
+
+    profile_id = await db.add_profile("ReaderUser", "TEST", "BINANCE")
+    profiles = await db.get_profiles()
+    assert any(p['id'] == profile_id for p in profiles)
+
+    async with db._acquire_reader() as conn:
+        assert conn is not db._db
+        with pytest.raises(sqlite3.OperationalError):
+            await conn.execute("DELETE FROM profiles")
+
+    await db.close()
+    assert db._readers is None
+
+@pytest.mark.asyncio
+async def test_connection_pragmas_applied():
+    db_path = get_test_db_path()
+    db = DataManager(db_path)
+    await db.initialize()
+
+    async def pragma(conn, name):
+        async with conn.execute(f"PRAGMA {name}") as cur:
+            return (await cur.fetchone())[0]
+
+    assert await pragma(db._db, "journal_mode") == "wal"
+    assert await pragma(db._db, "temp_store") == 2  # MEMORY
+    assert await pragma(db._db, "page_size") == 8192
+    async with db._acquire_reader() as conn:
+        assert await pragma(conn, "cache_size") == -65536
+        assert await pragma(conn, "busy_timeout") == 5000
+    await db.close()
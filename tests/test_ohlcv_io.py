@@ -0,0 +1,31 @@
+import pandas as pd
+import pytest
+from src.utils.ohlcv_io import resolve_ohlcv_path, read_ohlcv, write_ohlcv
+
+@pytest.fixture
+def candles():
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2024-01-01', periods=3, freq='h'),
+        'open': [1.0, 2.0, 3.0], 'high': [1.5, 2.5, 3.5],
+        'low': [0.5, 1.5, 2.5], 'close': [1.2, 2.2, 3.2], 'volume': [10.0, 20.0, 30.0]
+    })
+
+def test_csv_round_trip(tmp_path, candles):
+    base = str(tmp_path / "BINANCE_BTCUSDT_1h")
+    path = write_ohlcv(candles, base)
+    assert path.endswith('.csv')
+    assert resolve_ohlcv_path(base) == path
+    df = read_ohlcv(path)
+    assert pd.api.types.is_datetime64_any_dtype(df['timestamp'])
+    assert df['close'].tolist() == [1.2, 2.2, 3.2]
+
+def test_resolve_missing_returns_none(tmp_path):
+    assert resolve_ohlcv_path(str(tmp_path / "BINANCE_NONE_1h")) is None
+
+def test_parquet_preferred_over_csv(tmp_path, candles):
+    pytest.importorskip("pyarrow")
+    base = str(tmp_path / "BINANCE_BTCUSDT_1h")
+    write_ohlcv(candles, base)
+    path = write_ohlcv(candles, base, fmt='parquet')
+    assert resolve_ohlcv_path(base) == path
+    assert read_ohlcv(path)['timestamp'].iloc[-1] == candles['timestamp'].iloc[-1]
@@ -0,0 +1,18 @@
+import pandas as pd
+from src.utils.time_helper import ensure_datetime
+
+def test_ensure_datetime_passthrough():
+    col = pd.Series(pd.date_range('2024-01-01', periods=3, freq='h'))
+    assert ensure_datetime(col) is col
+
+def test_ensure_datetime_epoch_ms():
+    col = pd.Series([1704067200000, 1704070800000])
+    out = ensure_datetime(col)
+    assert out.iloc[0] == pd.Timestamp('2024-01-01 00:00:00')
+    assert out.iloc[1] == pd.Timestamp('2024-01-01 01:00:00')
+
+def test_ensure_datetime_csv_strings():
+    col = pd.Series(['2024-01-01 00:00:00', '2024-01-01 01:00:00'])
+    out = ensure_datetime(col)
+    assert pd.api.types.is_datetime64_any_dtype(out.dtype)
+    assert out.iloc[1] == pd.Timestamp('2024-01-01 01:00:00')